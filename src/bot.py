@@ -3,8 +3,10 @@ Smart Discord Music Bot - Main Entry Point
 """
 import asyncio
 import logging
+import os
 import signal
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import discord
@@ -49,7 +51,7 @@ class MusicBot(commands.Bot):
         # Database
         from src.config import config
         from src.database.connection import DatabaseManager
-        from src.database.crud import SongCRUD, UserCRUD, GuildCRUD, PlaybackCRUD, PreferenceCRUD, ReactionCRUD
+        from src.database.crud import SongCRUD, UserCRUD, GuildCRUD, PlaybackCRUD, PreferenceCRUD, ReactionCRUD, MetadataCacheCRUD
         
         self.db = await DatabaseManager.create(config.DATABASE_PATH)
         logger.info(f"Database initialized at {config.DATABASE_PATH}")
@@ -62,7 +64,8 @@ class MusicBot(commands.Bot):
         from src.services.preferences import PreferenceManager
         
         self.youtube = YouTubeService(config.YTDL_COOKIES_PATH, config.YTDL_PO_TOKEN)
-        self.spotify = SpotifyService(config.SPOTIFY_CLIENT_ID, config.SPOTIFY_CLIENT_SECRET)
+        metadata_cache = MetadataCacheCRUD(self.db)
+        self.spotify = SpotifyService(config.SPOTIFY_CLIENT_ID, config.SPOTIFY_CLIENT_SECRET, metadata_cache)
         self.normalizer = SongNormalizer(self.youtube)
         
         
@@ -186,6 +189,11 @@ class MusicBot(commands.Bot):
             except Exception:
                 pass
         
+        if getattr(self, "youtube", None):
+            await self.youtube.aclose()
+        if getattr(self, "spotify", None):
+            await self.spotify.aclose()
+        
         await super().close()
 
 
@@ -195,9 +203,16 @@ async def main():
     
     bot = MusicBot()
     
-    # Handle shutdown signals
     loop = asyncio.get_event_loop()
     
+    # Blocking YouTube lookups and yt-dlp extractions run in the default executor;
+    # size it for many concurrent lookups but keep it bounded
+    loop.set_default_executor(ThreadPoolExecutor(
+        max_workers=int(os.getenv("VEXO_THREAD_POOL_SIZE", "64")),
+        thread_name_prefix="vexo-io",
+    ))
+    
+    # Handle shutdown signals
     def signal_handler():
         logger.info("Received shutdown signal")
         asyncio.create_task(bot.close())
@@ -5,6 +5,7 @@ Runs on localhost only - no authentication required
 import asyncio
 import json
 import logging
+import time
 from collections import deque
 from datetime import datetime, UTC
 from pathlib import Path
@@ -18,6 +19,9 @@ logger = logging.getLogger(__name__)
 STATIC_DIR = Path(__file__).parent.parent / "web" / "static"
 TEMPLATE_DIR = Path(__file__).parent.parent / "web" / "templates"
 
+# Dashboard page, read from disk once on first request
+_INDEX_HTML: str | None = None
+
 
 class WebSocketLogHandler(logging.Handler):
     """Log handler that broadcasts to WebSocket clients."""
@@ -32,7 +36,6 @@ class WebSocketLogHandler(logging.Handler):
     def emit(self, record):
         if self.ws_manager.clients:
             # Rate limiting for Pi 3: Max 10 logs per second to the web dashboard
-            import time
             now = time.time()
             if int(now) == int(self._last_emit):
                 self._count_this_second += 1
@@ -149,10 +152,13 @@ class DashboardCog(commands.Cog):
         self.app.router.add_post("/api/guilds/{guild_id}/leave", self._handle_leave_guild)
     
     async def _handle_index(self, request: web.Request) -> web.Response:
-        html_file = TEMPLATE_DIR / "index.html"
-        if html_file.exists():
-            return web.Response(text=html_file.read_text(encoding='utf-8'), content_type="text/html")
-        return web.Response(text="Dashboard template not found", status=404)
+        global _INDEX_HTML
+        if _INDEX_HTML is None:
+            html_file = TEMPLATE_DIR / "index.html"
+            if not html_file.exists():
+                return web.Response(text="Dashboard template not found", status=404)
+            _INDEX_HTML = html_file.read_text(encoding='utf-8')
+        return web.Response(text=_INDEX_HTML, content_type="text/html")
     
     async def _handle_status(self, request: web.Request) -> web.Response:
         import psutil
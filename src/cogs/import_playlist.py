@@ -1,6 +1,7 @@
 """
 Import Cog - Playlist import commands
 """
+import asyncio
 import logging
 import re
 
@@ -41,16 +42,23 @@ class ImportCog(commands.Cog):
     
     async def _import_spotify(self, interaction: discord.Interaction, url: str):
         """Import a Spotify playlist."""
-        from src.config import config
-        
-        spotify = SpotifyService(config.SPOTIFY_CLIENT_ID, config.SPOTIFY_CLIENT_SECRET)
+        spotify = self._get_spotify()
         youtube = YouTubeService()
         normalizer = SongNormalizer(youtube)
         
         try:
-            # Get playlist tracks
+            # Get playlist tracks page by page, batch-fetching each page's
+            # artist genres while the next page downloads
             await interaction.followup.send("📥 Fetching Spotify playlist...", ephemeral=True)
-            tracks = await spotify.get_playlist_tracks(url)
+            tracks = []
+            seen_artist_ids = set()
+            genre_tasks = []
+            async for page in spotify.iter_playlist_pages(url):
+                tracks.extend(page)
+                new_artist_ids = list({t.artist_id for t in page} - seen_artist_ids)
+                seen_artist_ids.update(new_artist_ids)
+                if new_artist_ids:
+                    genre_tasks.append(asyncio.create_task(spotify.get_artists_batch(new_artist_ids)))
             
             if not tracks:
                 await interaction.edit_original_response(content="❌ No tracks found in playlist")
@@ -60,10 +68,11 @@ class ImportCog(commands.Cog):
                 content=f"📥 Found {len(tracks)} tracks. Fetching artist genres..."
             )
             
-            # Batch fetch artist genres
-            artist_ids = list(set(t.artist_id for t in tracks))
-            artists = await spotify.get_artists_batch(artist_ids)
-            artist_genres = {a.artist_id: a.genres for a in artists}
+            artist_genres = {
+                a.artist_id: a.genres
+                for artists in await asyncio.gather(*genre_tasks)
+                for a in artists
+            }
             
             # Attach genres to tracks
             for track in tracks:
@@ -132,10 +141,8 @@ class ImportCog(commands.Cog):
     
     async def _import_youtube(self, interaction: discord.Interaction, url: str):
         """Import a YouTube playlist."""
-        from src.config import config
-        
         youtube = YouTubeService()
-        spotify = SpotifyService(config.SPOTIFY_CLIENT_ID, config.SPOTIFY_CLIENT_SECRET)
+        spotify = self._get_spotify()
         
         # Extract playlist ID
         playlist_id = self._extract_yt_playlist_id(url)
@@ -158,22 +165,17 @@ class ImportCog(commands.Cog):
                 content=f"📥 Found {len(tracks)} tracks. Looking up metadata..."
             )
             
-            # For each track, try to get metadata from Spotify
-            spotify_tracks = []
-            for i, track in enumerate(tracks):
-                if i % 10 == 0 and i > 0:
-                    await interaction.edit_original_response(
-                        content=f"📥 Processing track {i}/{len(tracks)}..."
-                    )
-                
-                # Search Spotify for metadata
-                sp_track = await spotify.search_track(f"{track.artist} {track.title}")
-                if sp_track:
-                    # Get artist genres
-                    artist = await spotify.get_artist(sp_track.artist_id)
-                    if artist:
-                        sp_track.genres = artist.genres
-                    spotify_tracks.append(sp_track)
+            async def report_progress(done: int, total: int) -> None:
+                await interaction.edit_original_response(
+                    content=f"📥 Processing track {done}/{total}..."
+                )
+            
+            # Look up Spotify metadata for all tracks at once (artist genres are batched)
+            results = await spotify.search_tracks_batch(
+                [(t.title, t.artist) for t in tracks],
+                on_progress=report_progress,
+            )
+            spotify_tracks = [t for t in results if t]
             
             await interaction.edit_original_response(
                 content=f"📥 Found metadata for {len(spotify_tracks)} tracks. Learning preferences..."
@@ -235,6 +237,14 @@ class ImportCog(commands.Cog):
             logger.error(f"Error importing YouTube playlist: {e}")
             await interaction.edit_original_response(content=f"❌ Error: {e}")
     
+    def _get_spotify(self) -> SpotifyService:
+        """Use the bot's shared Spotify service so its HTTP session and token are reused."""
+        spotify = getattr(self.bot, "spotify", None)
+        if spotify is None:
+            from src.config import config
+            spotify = self.bot.spotify = SpotifyService(config.SPOTIFY_CLIENT_ID, config.SPOTIFY_CLIENT_SECRET)
+        return spotify
+    
     def _extract_yt_playlist_id(self, url: str) -> str | None:
         """Extract playlist ID from YouTube URL."""
         # Patterns for YouTube playlist URLs
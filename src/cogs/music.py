@@ -3,6 +3,7 @@ Music Cog - Playback commands and audio streaming
 """
 import asyncio
 import logging
+import random
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, UTC
 from typing import Optional
@@ -11,11 +12,15 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
+from src.services.discovery import CHART_REGIONS
 from src.services.youtube import YouTubeService, YTTrack
 from src.database.crud import SongCRUD, UserCRUD, PlaybackCRUD, ReactionCRUD, GuildCRUD, AnalyticsCRUD
 
 logger = logging.getLogger(__name__)
 
+# Longest Spotify rate-limit cooldown worth waiting for before a song starts
+SPOTIFY_MAX_WAIT = 2.0
+
 
 @dataclass
 class QueueItem:
@@ -215,6 +220,7 @@ class MusicCog(commands.Cog):
                 await self._end_session(player)
                 await player.voice_client.disconnect(force=True)
         
+        await self.youtube.aclose()
         logger.info("Music cog unloaded")
     
     async def _get_ephemeral_duration(self, guild_id: int) -> int:
@@ -696,6 +702,11 @@ class MusicCog(commands.Cog):
                 player.current = item
                 player.last_activity = datetime.now(UTC)
                 
+                # Resolve the stream URL in the background while DB logging / enrichment run
+                url_task = None
+                if not item.url:
+                    url_task = asyncio.create_task(self.youtube.get_stream_url(item.video_id))
+                
                 # Database: Ensure session and log playback
                 history_id = None
                 if hasattr(self.bot, "db") and self.bot.db:
@@ -720,10 +731,9 @@ class MusicCog(commands.Cog):
                             )
 
                             # Log initial listeners
-                            for m in player.voice_client.channel.members:
-                                if not m.bot:
-                                    await user_crud.get_or_create(m.id, m.name)
-                                    await playback_crud.add_listener(player.session_id, m.id)
+                            listeners = [m for m in player.voice_client.channel.members if not m.bot]
+                            await user_crud.get_or_create_many([(m.id, m.name) for m in listeners])
+                            await playback_crud.add_listeners(player.session_id, [m.id for m in listeners])
                         
                         # 2. Check Song Existence and Persistence Policy
                         if not item.song_db_id:
@@ -741,59 +751,13 @@ class MusicCog(commands.Cog):
                             )
                             item.song_db_id = song["id"]
                             
-                            # If it was ephemeral and now requested by user, make it permanent
                             # If it was ephemeral and now requested by user, make it permanent
                             if not is_ephemeral and song.get("is_ephemeral"):
                                 await song_crud.make_permanent(song["id"])
                         
                         # Metadata Enrichment Logic (Prioritizing Spotify for accuracy)
-                        spotify = getattr(self.bot, "spotify", None)
-                        if spotify:
-                            try:
-                                # Always attempt Spotify lookup for better Genre/Year quality
-                                query = f"{item.artist} {item.title}"
-                                sp_track = await spotify.search_track(query)
-                                if sp_track:
-                                    # Spotify is the source of truth for year and genre
-                                    item.year = sp_track.release_year
-                                    
-                                    # Get precise genres from Spotify Artist
-                                    artist = await spotify.get_artist(sp_track.artist_id)
-                                    if artist and artist.genres:
-                                        # Use primary genre
-                                        item.genre = artist.genres[0].title()
-                                        
-                                        # Clear old/wrong genres and save confirmed one to DB
-                                        if item.song_db_id:
-                                            await song_crud.clear_genres(item.song_db_id)
-                                            await song_crud.add_genre(item.song_db_id, item.genre)
-                                    
-                                    # Sync back to main song table
-                                    if item.song_db_id:
-                                        await song_crud.get_or_create_by_yt_id(
-                                            canonical_yt_id=item.video_id,
-                                            title=item.title,
-                                            artist_name=item.artist,
-                                            release_year=item.year,
-                                            duration_seconds=item.duration_seconds
-                                        )
-                            except Exception as e:
-                                logger.debug(f"Spotify enrichment failed: {e}")
+                        await self._resolve_metadata(item, song_crud)
                         
-                        # Fallback: Populate from DB if Spotify failed or was unavailable
-                        if (not item.year or not item.genre) and item.song_db_id:
-                            if 'song' not in locals():
-                                song = await song_crud.get_by_id(item.song_db_id)
-                            
-                            if song:
-                                if not item.year: item.year = song.get("release_year")
-                                if not item.duration_seconds: item.duration_seconds = song.get("duration_seconds")
-                                
-                                if not item.genre:
-                                    genres = await song_crud.get_genres(item.song_db_id)
-                                    if genres:
-                                        item.genre = genres[0].title()
-
                         # 3. Log play
                         if item.song_db_id:
                              # Ensure user exists for FK constraint
@@ -825,8 +789,8 @@ class MusicCog(commands.Cog):
                 
                 # 2. Get stream URL (Use pre-fetched if available)
                 url = item.url
-                if not url:
-                    url = await self.youtube.get_stream_url(item.video_id)
+                if not url and url_task:
+                    url = await url_task
                 
                 if not url:
                     logger.error(f"Failed to get stream URL for {item.video_id}")
@@ -922,6 +886,77 @@ class MusicCog(commands.Cog):
             player.is_playing = False
             player.current = None
     
+    async def _resolve_metadata(self, item: QueueItem, song_crud: SongCRUD) -> None:
+        """
+        Fill in year/genre, with Spotify as the source of truth.
+        
+        Replays are served from the Spotify lookup cache, so there is no point racing
+        it against the DB; stored metadata only fills whatever is still missing.
+        """
+        spotify_meta = await self._fetch_spotify_metadata(item)
+        if spotify_meta:
+            # Spotify is the source of truth for year and genre
+            item.year, genre = spotify_meta
+            if genre:
+                item.genre = genre
+                
+                # Clear old/wrong genres and save confirmed one to DB
+                if item.song_db_id:
+                    await song_crud.clear_genres(item.song_db_id)
+                    await song_crud.add_genre(item.song_db_id, item.genre)
+            
+            # Sync back to main song table
+            if item.song_db_id:
+                await song_crud.get_or_create_by_yt_id(
+                    canonical_yt_id=item.video_id,
+                    title=item.title,
+                    artist_name=item.artist,
+                    release_year=item.year,
+                    duration_seconds=item.duration_seconds
+                )
+        
+        # Fallback: Populate from DB if Spotify failed or was unavailable
+        if (not item.year or not item.genre) and item.song_db_id:
+            stored = await self._fetch_stored_metadata(song_crud, item.song_db_id)
+            if stored:
+                if not item.year: item.year = stored["year"]
+                if not item.duration_seconds: item.duration_seconds = stored["duration_seconds"]
+                if not item.genre: item.genre = stored["genre"]
+    
+    async def _fetch_spotify_metadata(self, item: QueueItem) -> tuple[int | None, str | None] | None:
+        """Look up (release_year, primary genre) on Spotify."""
+        spotify = getattr(self.bot, "spotify", None)
+        if not spotify:
+            return None
+        try:
+            sp_track = await spotify.search_track(f"{item.artist} {item.title}", max_wait=SPOTIFY_MAX_WAIT)
+            if not sp_track:
+                return None
+            
+            # Get precise genres from Spotify Artist, use primary genre
+            artist = await spotify.get_artist(sp_track.artist_id, max_wait=SPOTIFY_MAX_WAIT)
+            genre = artist.genres[0].title() if artist and artist.genres else None
+            return sp_track.release_year, genre
+        except Exception as e:
+            logger.debug(f"Spotify enrichment failed: {e}")
+            return None
+    
+    async def _fetch_stored_metadata(self, song_crud: SongCRUD, song_id: int) -> dict | None:
+        """Get year/duration/primary genre already stored for a song."""
+        try:
+            song = await song_crud.get_with_genres(song_id)
+            if not song:
+                return None
+            genres = song["genres"]
+            return {
+                "year": song.get("release_year"),
+                "duration_seconds": song.get("duration_seconds"),
+                "genre": genres[0].title() if genres else None,
+            }
+        except Exception as e:
+            logger.debug(f"Failed to load stored metadata for song {song_id}: {e}")
+            return None
+    
     async def _get_discovery_song(self, player: GuildPlayer) -> QueueItem | None:
         """Get next song from discovery engine."""
         # Get voice channel members
@@ -941,9 +976,10 @@ class MusicCog(commands.Cog):
                 if hasattr(self.bot, "db"):
                     from src.database.crud import GuildCRUD
                     guild_crud = GuildCRUD(self.bot.db)
+                    settings = await guild_crud.get_all_settings(player.guild_id)
                     
                     # Fetch cooldown
-                    setting_cooldown = await guild_crud.get_setting(player.guild_id, "replay_cooldown")
+                    setting_cooldown = settings.get("replay_cooldown")
                     if setting_cooldown:
                         try:
                             cooldown = int(setting_cooldown)
@@ -951,7 +987,7 @@ class MusicCog(commands.Cog):
                             pass
                     
                     # Fetch discovery weights
-                    setting_weights = await guild_crud.get_setting(player.guild_id, "discovery_weights")
+                    setting_weights = settings.get("discovery_weights")
                     if setting_weights:
                         weights = setting_weights
 
@@ -984,9 +1020,7 @@ class MusicCog(commands.Cog):
     
     async def _get_chart_fallback(self) -> QueueItem | None:
         """Get a random track from Top 100 US/UK charts as fallback."""
-        import random
-        
-        region = random.choice(["US", "UK"])
+        region = random.choice(CHART_REGIONS)
         query = f"Top 100 Songs {region} 2024"
         
         logger.info(f"Searching for chart playlist: {query}")
@@ -11,6 +11,10 @@ import aiosqlite
 
 logger = logging.getLogger(__name__)
 
+# Size of sqlite3's per-connection LRU of compiled statements (keyed by SQL text); larger
+# than the default 128 so hot lookups are less likely to be evicted and re-prepared
+STATEMENT_CACHE_SIZE = 256
+
 
 class DatabaseManager:
     """Async SQLite database connection manager."""
@@ -118,11 +122,15 @@ class DatabaseManager:
         # internal locking. Removing the asyncio.Lock prevents the dashboard 
         # from blocking the bot's commands during heavy reads.
         if self._connection is None:
-            self._connection = await aiosqlite.connect(self.db_path)
+            self._connection = await aiosqlite.connect(self.db_path, cached_statements=STATEMENT_CACHE_SIZE)
             self._connection.row_factory = aiosqlite.Row
             # Enable persistent PRAGMAs
             await self._connection.execute("PRAGMA foreign_keys = ON")
             await self._connection.execute("PRAGMA journal_mode=WAL")
+            # synchronous is per-connection; NORMAL is safe under WAL and avoids an fsync per commit
+            await self._connection.execute("PRAGMA synchronous=NORMAL")
+            await self._connection.execute("PRAGMA temp_store=MEMORY")
+            await self._connection.execute("PRAGMA mmap_size=268435456")
         
         try:
             yield self._connection
@@ -137,6 +145,12 @@ class DatabaseManager:
             await db.commit()
             return cursor
     
+    async def execute_many(self, query: str, params_seq: list[tuple]) -> None:
+        """Execute a query once per parameter tuple in a single transaction."""
+        async with self.connection() as db:
+            await db.executemany(query, params_seq)
+            await db.commit()
+    
     async def fetch_one(self, query: str, params: tuple = ()) -> dict | None:
         """Fetch a single row as a dictionary."""
         async with self.connection() as db:
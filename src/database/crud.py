@@ -87,7 +87,7 @@ class SongCRUD:
         )
 
     async def get_genres(self, song_id: int) -> list[str]:
-        """Get genres for a song."""
+        """Get all genres for a song."""
         rows = await self.db.fetch_all(
             "SELECT genre FROM song_genres WHERE song_id = ?",
             (song_id,)
@@ -98,6 +98,20 @@ class SongCRUD:
         """Get song by ID."""
         return await self.db.fetch_one("SELECT * FROM songs WHERE id = ?", (song_id,))
 
+    async def get_with_genres(self, song_id: int) -> dict | None:
+        """Get song by ID with its genres as a "genres" list, in one query."""
+        song = await self.db.fetch_one(
+            """SELECT s.*, GROUP_CONCAT(g.genre, char(31)) AS genres
+               FROM songs s
+               LEFT JOIN song_genres g ON g.song_id = s.id
+               WHERE s.id = ?
+               GROUP BY s.id""",
+            (song_id,)
+        )
+        if song:
+            song["genres"] = song["genres"].split("\x1f") if song["genres"] else []
+        return song
+
     async def get_or_create_by_spotify_id(
         self,
         spotify_id: str,
@@ -138,15 +152,6 @@ class SongCRUD:
     async def clear_genres(self, song_id: int) -> None:
         """Clear all genres for a song."""
         await self.db.execute("DELETE FROM song_genres WHERE song_id = ?", (song_id,))
-    
-    
-    async def get_genres(self, song_id: int) -> list[str]:
-        """Get all genres for a song."""
-        rows = await self.db.fetch_all(
-            "SELECT genre FROM song_genres WHERE song_id = ?",
-            (song_id,)
-        )
-        return [row["genre"] for row in rows]
 
 
 class UserCRUD:
@@ -174,6 +179,19 @@ class UserCRUD:
         )
         return await self.db.fetch_one("SELECT * FROM users WHERE id = ?", (user_id,))
     
+    async def get_or_create_many(self, users: list[tuple[int, str | None]]) -> None:
+        """Create or touch many (user_id, username) pairs in one batch."""
+        if not users:
+            return
+        now = datetime.now(UTC)
+        await self.db.execute_many(
+            """INSERT INTO users (id, username, last_active) VALUES (?, ?, ?)
+               ON CONFLICT(id) DO UPDATE SET
+                   last_active = excluded.last_active,
+                   username = COALESCE(excluded.username, users.username)""",
+            [(user_id, username, now) for user_id, username in users]
+        )
+    
     async def set_opt_out(self, user_id: int, opted_out: bool) -> None:
         """Set user opt-out status for preference tracking."""
         await self.db.execute(
@@ -303,6 +321,15 @@ class PlaybackCRUD:
             (session_id, user_id)
         )
     
+    async def add_listeners(self, session_id: str, user_ids: list[int]) -> None:
+        """Add several listeners to a session in one batch."""
+        if not user_ids:
+            return
+        await self.db.execute_many(
+            "INSERT INTO session_listeners (session_id, user_id) VALUES (?, ?)",
+            [(session_id, user_id) for user_id in user_ids]
+        )
+    
     async def remove_listener(self, session_id: str, user_id: int) -> None:
         """Mark a listener as having left the session."""
         await self.db.execute(
@@ -885,3 +912,41 @@ class LibraryCRUD:
             LIMIT ?
         """
         return await self.db.fetch_all(query, (limit,))
+
+
+class MetadataCacheCRUD:
+    """Persistent cache for external metadata lookups."""
+    
+    def __init__(self, db: DatabaseManager):
+        self.db = db
+    
+    async def get_many(self, keys: list[str]) -> dict[str, tuple[Any, int]]:
+        """Get cached payloads with their fetch time (unix seconds), keyed by cache key."""
+        result = {}
+        # Chunk to stay under SQLite's bound parameter limit
+        for i in range(0, len(keys), 500):
+            chunk = keys[i:i+500]
+            rows = await self.db.fetch_all(
+                f"SELECT key, json, fetched_at FROM metadata_cache WHERE key IN ({', '.join('?' * len(chunk))})",
+                tuple(chunk)
+            )
+            for row in rows:
+                try:
+                    result[row["key"]] = (json.loads(row["json"]), row["fetched_at"])
+                except json.JSONDecodeError:
+                    continue
+        return result
+    
+    async def put_many(self, entries: list[tuple[str, Any]]) -> None:
+        """Insert or replace (key, payload) entries, stamped with the current time."""
+        await self.db.execute_many(
+            "INSERT OR REPLACE INTO metadata_cache (key, json, fetched_at) VALUES (?, ?, strftime('%s', 'now'))",
+            [(key, json.dumps(payload)) for key, payload in entries]
+        )
+    
+    async def prune(self, max_age_seconds: int) -> None:
+        """Delete entries older than max_age_seconds."""
+        await self.db.execute(
+            "DELETE FROM metadata_cache WHERE fetched_at < CAST(strftime('%s', 'now') AS INTEGER) - ?",
+            (max_age_seconds,)
+        )
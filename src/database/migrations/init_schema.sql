@@ -127,6 +127,13 @@ CREATE TABLE IF NOT EXISTS notifications (
     read BOOLEAN DEFAULT FALSE
 );
 
+-- metadata_cache (persistent cache of external API lookups, e.g. Spotify)
+CREATE TABLE IF NOT EXISTS metadata_cache (
+    key TEXT PRIMARY KEY,
+    json TEXT NOT NULL,
+    fetched_at INTEGER NOT NULL
+);
+
 -- New table for tracking song additions to the library
 CREATE TABLE IF NOT EXISTS song_library_entries (
     user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
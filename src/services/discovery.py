@@ -15,6 +15,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Chart regions picked from for wildcard discovery
+CHART_REGIONS = ("US", "UK")
+
 
 @dataclass
 class DiscoveredSong:
@@ -78,6 +81,9 @@ class DiscoveryEngine:
     """Intelligent song discovery engine."""
     
     DEFAULT_WEIGHTS = {"similar": 25, "artist": 25, "wildcard": 25, "library": 25}
+    # DEFAULT_WEIGHTS split once for random.choices, used whenever no custom weights apply
+    _DEFAULT_STRATEGIES = tuple(DEFAULT_WEIGHTS)
+    _DEFAULT_STRATEGY_WEIGHTS = tuple(DEFAULT_WEIGHTS.values())
     
     def __init__(
         self,
@@ -120,11 +126,13 @@ class DiscoveryEngine:
             return None
         
         # Get weights (from settings or defaults)
-        weights = weights or self.DEFAULT_WEIGHTS
-        
         # Migration: If old 3-strategy weights are found, reset to new 4-strategy default
-        if weights and "library" not in weights:
-            weights = self.DEFAULT_WEIGHTS
+        if not weights or "library" not in weights:
+            strategies = self._DEFAULT_STRATEGIES
+            strategy_weights = self._DEFAULT_STRATEGY_WEIGHTS
+        else:
+            strategies = list(weights.keys())
+            strategy_weights = [weights[s] for s in strategies]
         
         # Get recent history (Cooldown check)
         # Using cooldown_seconds parameter (defaults to 2 hours)
@@ -138,8 +146,6 @@ class DiscoveryEngine:
         recent_yt_ids.update(r["canonical_yt_id"] for r in recent_by_count)
         
         # Roll strategy
-        strategies = list(weights.keys())
-        strategy_weights = [weights[s] for s in strategies]
         strategy = random.choices(strategies, weights=strategy_weights, k=1)[0]
         
         logger.info(f"Discovery for user {turn_user_id} using strategy: {strategy} (avoiding {len(recent_yt_ids)} recent songs)")
@@ -268,7 +274,7 @@ class DiscoveryEngine:
     async def _strategy_wildcard(self, recent_yt_ids: set[str]) -> YTTrack | None:
         """Get a random song from charts."""
         # Randomly pick US or UK charts
-        region = random.choice(["US", "UK"])
+        region = random.choice(CHART_REGIONS)
         query = f"Top 100 Songs {region} 2024"
         
         # Search for chart playlists
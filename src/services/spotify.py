@@ -1,14 +1,52 @@
 import asyncio
 import logging
+import os
 import random
-from dataclasses import dataclass
-from functools import partial, wraps
+import time
+import unicodedata
+from dataclasses import asdict, dataclass, replace
+from functools import wraps
+from typing import TYPE_CHECKING, AsyncIterator, Awaitable, Callable
 
-import spotipy
-from spotipy.oauth2 import SpotifyClientCredentials
+import httpx
+from cachetools import TTLCache
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+if TYPE_CHECKING:
+    from src.database.crud import MetadataCacheCRUD
 
 logger = logging.getLogger(__name__)
 
+_SPOTIFY_API = "https://api.spotify.com/v1"
+_SPOTIFY_TOKEN_URL = "https://accounts.spotify.com/api/token"
+
+# Retries of the same call after a 429/5xx before giving up
+RATE_LIMIT_RETRIES = 3
+
+# Base delay for 5xx retries without Retry-After, doubled per attempt (0.3s, 0.6s, 1.2s)
+_RETRY_BACKOFF = 0.3
+
+# Lifetime of a cached lookup, in memory and on disk
+CACHE_TTL = 86_400
+
+# Expired rows are deleted from the persistent cache at most this often, piggybacking on writes
+_PRUNE_INTERVAL = 3600
+
+# Negative entries (no results / no genres) are re-fetched after this many seconds instead of the full cache TTL
+_NEG_TTL = 3600
+
+# Cached marker for a search that returned no results
+_NOT_FOUND = object()
+
+
+def _normalize_query(query: str) -> str:
+    """Normalize a free-text query so unicode/case variants share a cache entry."""
+    return unicodedata.normalize("NFKC", query).casefold().strip()
+
 
 def retry_with_backoff(retries=3, initial_backoff=1):
     def decorator(func):
@@ -31,6 +69,81 @@ def retry_with_backoff(retries=3, initial_backoff=1):
     return decorator
 
 
+class SpotifyAPIError(Exception):
+    """Non-success response from the Spotify Web API."""
+    
+    def __init__(self, http_status: int, message: str, headers=None):
+        super().__init__(f"HTTP {http_status}: {message}")
+        self.http_status = http_status
+        self.headers = headers or {}
+
+
+class _BatchDispatcher:
+    """
+    Coalesce single-key lookups made in the same event-loop tick into one batched call.
+    
+    fetch_many(keys) must return a dict of key -> result; keys it leaves out
+    resolve to None.
+    """
+    
+    def __init__(self, fetch_many, max_batch: int = 50):
+        self._fetch_many = fetch_many
+        self._max_batch = max_batch
+        self._queue: asyncio.Queue | None = None
+        self._worker: asyncio.Task | None = None
+        self._pending: set[asyncio.Task] = set()
+        # Every future handed out by submit() that hasn't resolved yet, queued or in a batch
+        self._futures: set[asyncio.Future] = set()
+    
+    async def submit(self, key: str):
+        """Queue a key for the next batch and wait for its result."""
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+        future = asyncio.get_running_loop().create_future()
+        self._futures.add(future)
+        future.add_done_callback(self._futures.discard)
+        self._queue.put_nowait((key, future))
+        return await future
+    
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            # Yield once so every caller in this tick gets to enqueue
+            await asyncio.sleep(0)
+            while len(batch) < self._max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            
+            task = asyncio.create_task(self._dispatch(batch))
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+    
+    async def _dispatch(self, batch: list[tuple[str, asyncio.Future]]) -> None:
+        try:
+            results = await self._fetch_many(list(dict.fromkeys(key for key, _ in batch)))
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for key, future in batch:
+            if not future.done():
+                future.set_result(results.get(key))
+    
+    def close(self) -> None:
+        """Stop the worker and anything still in flight, failing every outstanding submit()."""
+        for task in (self._worker, *self._pending):
+            if task and not task.done():
+                task.cancel()
+        self._worker = None
+        self._queue = None
+        
+        error = RuntimeError("Spotify batch dispatcher closed")
+        for future in list(self._futures):
+            if not future.done():
+                future.set_exception(error)
+
+
 @dataclass
 class SpotifyTrack:
     """Spotify track info."""
@@ -57,30 +170,284 @@ class SpotifyArtist:
 class SpotifyService:
     """Spotify API wrapper."""
     
-    def __init__(self, client_id: str, client_secret: str):
-        self.sp = spotipy.Spotify(
-            auth_manager=SpotifyClientCredentials(
-                client_id=client_id,
-                client_secret=client_secret
-            ),
-            requests_timeout=1  # User requested ultra-short 1s timeout
-        )
+    # Concurrency limits keyed by client ID, shared by every instance using the same app credentials
+    _semaphores: dict[str, asyncio.Semaphore] = {}
+    
+    # Rate-limit cooldowns keyed by client ID: monotonic time until which no request should be sent
+    _blocked_until: dict[str, float] = {}
+    
+    # One HTTP/2 client for every instance, so concurrent requests multiplex over a single connection
+    _client: httpx.AsyncClient | None = None
+    
+    # Hot lookups shared by all instances, in front of the persistent cache: key -> (value, stored_at, is_negative)
+    _cache: TTLCache = TTLCache(maxsize=4096, ttl=CACHE_TTL)
+    _last_prune: float | None = None
+    
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        metadata_cache: "MetadataCacheCRUD | None" = None,
+    ):
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.metadata_cache = metadata_cache
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._token: str | None = None
+        self._token_expires_at = 0.0
+        self._token_lock = asyncio.Lock()
+        self._artist_batcher = _BatchDispatcher(self._fetch_artists_by_ids)
+    
+    @classmethod
+    def _get_client(cls) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use."""
+        if cls._client is None or cls._client.is_closed:
+            cls._client = httpx.AsyncClient(
+                http2=True,
+                # User requested ultra-short 1s timeout
+                timeout=httpx.Timeout(None, connect=1.0, read=1.0),
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            )
+        return cls._client
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        self._artist_batcher.close()
+        client, SpotifyService._client = SpotifyService._client, None
+        if client is not None and not client.is_closed:
+            await client.aclose()
+    
+    async def _get_token(self) -> str:
+        """Get a client-credentials access token, refreshing it shortly before expiry."""
+        async with self._token_lock:
+            if self._token and time.monotonic() < self._token_expires_at:
+                return self._token
+            
+            resp = await self._get_client().post(
+                _SPOTIFY_TOKEN_URL,
+                data={"grant_type": "client_credentials"},
+                auth=(self.client_id, self.client_secret),
+            )
+            if resp.status_code != 200:
+                raise SpotifyAPIError(resp.status_code, resp.text, resp.headers)
+            data = _json.loads(resp.content)
+            
+            self._token = data["access_token"]
+            self._token_expires_at = time.monotonic() + data.get("expires_in", 3600) - 60
+            return self._token
+    
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get the shared concurrency limit for this client ID."""
+        semaphore = self._semaphores.get(self.client_id)
+        if semaphore is None:
+            limit = int(os.getenv("SPOTIFY_MAX_CONCURRENCY", "4"))
+            semaphore = self._semaphores[self.client_id] = asyncio.Semaphore(limit)
+        return semaphore
+    
+    def _cooldown_remaining(self) -> float:
+        """Seconds left on this client ID's rate-limit cooldown (0 if not rate limited)."""
+        return max(0.0, self._blocked_until.get(self.client_id, 0.0) - time.monotonic())
+    
+    def _wait_too_long(self, max_wait: float | None) -> bool:
+        """Whether a caller with this max_wait should give up rather than wait out the cooldown."""
+        return max_wait is not None and self._cooldown_remaining() > max_wait
+    
+    async def _single_flight(self, key: str, lookup):
+        """
+        Run lookup() at most once at a time per cache key.
+        
+        Concurrent callers for the same key await the same task instead of
+        firing duplicate requests. The task is shielded so one caller being
+        cancelled doesn't fail the others.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(lookup())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        result = await asyncio.shield(task)
+        return replace(result) if result is not None else None
+    
+    def _memory_get(self, key: str):
+        """
+        Get a copy of a result from the in-memory cache.
+        
+        Returns None on a miss or expired entry, and _NOT_FOUND for a cached
+        search that had no results. Age is measured from when the result was
+        fetched, so entries promoted from the persistent cache keep their age.
+        """
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        value, stored_at, negative = entry
+        if time.time() - stored_at > (_NEG_TTL if negative else CACHE_TTL):
+            return None
+        return value if value is _NOT_FOUND else replace(value)
+    
+    async def _cache_get(self, key: str):
+        """Get a cached lookup result (see _memory_get), falling back to the persistent cache."""
+        return (await self._cache_get_many([key])).get(key)
+    
+    async def _cache_get_many(self, keys: list[str]) -> dict:
+        """Get cached lookup results by key; keys that aren't cached are left out."""
+        found = {}
+        missing = []
+        for key in keys:
+            value = self._memory_get(key)
+            if value is None:
+                missing.append(key)
+            else:
+                found[key] = value
+        
+        if missing and self.metadata_cache:
+            try:
+                rows = await self.metadata_cache.get_many(missing)
+            except Exception as e:
+                logger.debug(f"Spotify cache read failed: {e}")
+                rows = {}
+            
+            now = time.time()
+            for key, (payload, fetched_at) in rows.items():
+                try:
+                    negative = payload.get("negative", False)
+                    if now - fetched_at > (_NEG_TTL if negative else CACHE_TTL):
+                        continue
+                    value = self._decode_cached(key, payload.get("value"))
+                except (TypeError, KeyError, AttributeError) as e:
+                    # Stale shape (e.g. a dataclass field changed); treat as a miss so the next fetch overwrites it
+                    logger.debug(f"Ignoring unreadable Spotify cache entry {key}: {e}")
+                    continue
+                self._cache[key] = (value, fetched_at, negative)
+                found[key] = value if value is _NOT_FOUND else replace(value)
+        
+        return found
+    
+    async def _cache_put(self, key: str, value, negative: bool = False) -> None:
+        """Store a lookup result in the shared cache."""
+        await self._cache_put_many([(key, value, negative)])
+    
+    async def _cache_put_many(self, entries: list[tuple[str, object, bool]]) -> None:
+        """Store (key, value, negative) lookup results in memory and in the persistent cache."""
+        now = time.time()
+        payloads = []
+        for key, value, negative in entries:
+            if value is _NOT_FOUND:
+                self._cache[key] = (value, now, True)
+                payloads.append((key, {"negative": True, "value": None}))
+            else:
+                self._cache[key] = (replace(value), now, negative)
+                payloads.append((key, {"negative": negative, "value": asdict(value)}))
+        
+        if self.metadata_cache and payloads:
+            try:
+                await self.metadata_cache.put_many(payloads)
+                if SpotifyService._last_prune is None or time.monotonic() - SpotifyService._last_prune > _PRUNE_INTERVAL:
+                    SpotifyService._last_prune = time.monotonic()
+                    await self.metadata_cache.prune(max_age_seconds=CACHE_TTL)
+            except Exception as e:
+                logger.debug(f"Spotify cache write failed: {e}")
+    
+    @staticmethod
+    def _decode_cached(key: str, data: dict | None):
+        """Rebuild a cached dataclass from its persisted form."""
+        if data is None:
+            return _NOT_FOUND
+        if key.startswith("track:"):
+            return SpotifyTrack(**data)
+        return SpotifyArtist(**data)
+    
+    @staticmethod
+    def _artist_entry(artist: "SpotifyArtist") -> tuple[str, "SpotifyArtist", bool]:
+        """Cache entry for an artist, negative (short-lived) if it has no genres."""
+        return (f"artist:{artist.artist_id}", artist, not artist.genres)
+    
+    async def _get(self, path_or_url: str, params: dict | None = None, max_wait: float | None = None) -> dict:
+        """
+        GET a Web API endpoint, backing off on 429 (using Retry-After) and 5xx.
+        
+        A 429 puts every caller with the same client ID into a shared cooldown
+        instead of letting them keep hitting the limit. With max_wait set, the
+        call fails instead of waiting out a longer cooldown.
+        """
+        url = path_or_url if path_or_url.startswith("https://") else f"{_SPOTIFY_API}{path_or_url}"
+        client = self._get_client()
+        attempt = 0
+        token_refreshed = False
+        while True:
+            cooldown = self._cooldown_remaining()
+            if cooldown:
+                if self._wait_too_long(max_wait):
+                    raise SpotifyAPIError(429, f"Rate limited for another {cooldown:.1f}s")
+                await asyncio.sleep(cooldown + random.uniform(0, 0.25))
+            
+            async with self._get_semaphore():
+                token = await self._get_token()
+                resp = await client.get(url, params=params, headers={"Authorization": f"Bearer {token}"})
+                if resp.status_code == 200:
+                    return _json.loads(resp.content)
+                if resp.status_code == 401 and not token_refreshed:
+                    # Token revoked/expired early - force a refresh and retry once, outside the retry budget
+                    self._token = None
+                    token_refreshed = True
+                    continue
+                if not (resp.status_code == 429 or resp.status_code >= 500) or attempt >= RATE_LIMIT_RETRIES:
+                    raise SpotifyAPIError(resp.status_code, resp.text, resp.headers)
+                retry_after = resp.headers.get("Retry-After")
+            
+            try:
+                sleep = float(retry_after)
+            except (TypeError, ValueError):
+                sleep = _RETRY_BACKOFF * 2 ** attempt
+            attempt += 1
+            
+            if resp.status_code == 429:
+                # Shared by every caller; the wait happens at the top of the loop
+                blocked_until = time.monotonic() + sleep
+                if blocked_until > self._blocked_until.get(self.client_id, 0.0):
+                    self._blocked_until[self.client_id] = blocked_until
+                logger.warning(f"Spotify rate limited, retry {attempt}/{RATE_LIMIT_RETRIES} for {url} after {sleep:.2f}s")
+                continue
+            
+            sleep += random.uniform(0, 0.25)
+            logger.warning(f"Spotify request failed, retry {attempt}/{RATE_LIMIT_RETRIES} for {url} after {sleep:.2f}s")
+            await asyncio.sleep(sleep)
     
     @retry_with_backoff(retries=3, initial_backoff=1)
-    async def search_track(self, query: str) -> SpotifyTrack | None:
-        """Search for a track."""
-        loop = asyncio.get_event_loop()
+    async def search_track(self, query: str, max_wait: float | None = None) -> SpotifyTrack | None:
+        """
+        Search for a track.
+        
+        max_wait bounds how long a rate-limit cooldown may delay the lookup;
+        past it the track is reported as not found.
+        """
+        cache_key = f"track:{_normalize_query(query)}"
+        cached = await self._cache_get(cache_key)
+        if cached is _NOT_FOUND:
+            return None
+        if cached:
+            return cached
+        if self._wait_too_long(max_wait):
+            return None
+        
+        return await self._single_flight(cache_key, lambda: self._fetch_track(query, cache_key, max_wait))
+    
+    async def _fetch_track(self, query: str, cache_key: str, max_wait: float | None = None) -> SpotifyTrack | None:
+        """
+        Search the API for a track and cache the outcome.
+        
+        The same request also searches artists; when the top artist is the
+        track's primary artist it is cached too, so the usual follow-up
+        get_artist() for genres is served without a second request.
+        """
         try:
-            results = await loop.run_in_executor(
-                None,
-                partial(self.sp.search, q=query, limit=1, type="track")
-            )
+            results = await self._get("/search", {"q": query, "limit": 1, "type": "track,artist"}, max_wait)
             
             if not results["tracks"]["items"]:
+                await self._cache_put(cache_key, _NOT_FOUND)
                 return None
             
             track = results["tracks"]["items"][0]
-            return SpotifyTrack(
+            result = SpotifyTrack(
                 spotify_id=track["id"],
                 title=track["name"],
                 artist=track["artists"][0]["name"],
@@ -90,6 +457,20 @@ class SpotifyService:
                 duration_seconds=track["duration_ms"] // 1000,
                 popularity=track["popularity"],
             )
+            entries = [(cache_key, result, False)]
+            
+            top_artists = results.get("artists", {}).get("items", [])
+            if top_artists and top_artists[0]["id"] == result.artist_id:
+                a = top_artists[0]
+                entries.append(self._artist_entry(SpotifyArtist(
+                    artist_id=a["id"],
+                    name=a["name"],
+                    genres=a.get("genres", []),
+                    popularity=a.get("popularity", 0),
+                )))
+            
+            await self._cache_put_many(entries)
+            return result
         except Exception as e:
             logger.error(f"Spotify search error: {e}")
             return None
@@ -97,85 +478,150 @@ class SpotifyService:
     @retry_with_backoff(retries=3, initial_backoff=1)
     async def search_artist(self, query: str) -> SpotifyArtist | None:
         """Search for an artist."""
-        loop = asyncio.get_event_loop()
+        cache_key = f"artist_search:{_normalize_query(query)}"
+        cached = await self._cache_get(cache_key)
+        if cached is _NOT_FOUND:
+            return None
+        if cached:
+            return cached
+        
+        return await self._single_flight(cache_key, lambda: self._fetch_artist_search(query, cache_key))
+    
+    async def _fetch_artist_search(self, query: str, cache_key: str) -> SpotifyArtist | None:
+        """Search the API for an artist and cache the outcome."""
         try:
-            results = await loop.run_in_executor(
-                None,
-                partial(self.sp.search, q=query, limit=1, type="artist")
-            )
+            results = await self._get("/search", {"q": query, "limit": 1, "type": "artist"})
             
             if not results["artists"]["items"]:
+                await self._cache_put(cache_key, _NOT_FOUND)
                 return None
             
             artist = results["artists"]["items"][0]
-            return SpotifyArtist(
+            result = SpotifyArtist(
                 artist_id=artist["id"],
                 name=artist["name"],
                 genres=artist.get("genres", []),
                 popularity=artist.get("popularity", 0),
             )
+            await self._cache_put_many([
+                (cache_key, result, not result.genres),
+                self._artist_entry(result),
+            ])
+            return result
         except Exception as e:
             logger.error(f"Spotify artist search error: {e}")
             return None
     
     @retry_with_backoff(retries=3, initial_backoff=1)
-    async def get_artist(self, artist_id: str) -> SpotifyArtist | None:
-        """Get artist info including genres."""
-        loop = asyncio.get_event_loop()
+    async def get_artist(self, artist_id: str, max_wait: float | None = None) -> SpotifyArtist | None:
+        """
+        Get artist info including genres.
+        
+        With max_wait set, returns None instead of waiting out a longer
+        rate-limit cooldown before the lookup is sent.
+        """
+        cache_key = f"artist:{artist_id}"
+        cached = await self._cache_get(cache_key)
+        if cached:
+            return cached
+        if self._wait_too_long(max_wait):
+            return None
+        
+        return await self._single_flight(cache_key, lambda: self._fetch_artist(artist_id))
+    
+    async def _fetch_artist(self, artist_id: str) -> SpotifyArtist | None:
+        """Fetch an artist, sharing one /artists request with other lookups in the same tick."""
         try:
-            artist = await loop.run_in_executor(
-                None,
-                partial(self.sp.artist, artist_id)
-            )
-            return SpotifyArtist(
-                artist_id=artist["id"],
-                name=artist["name"],
-                genres=artist.get("genres", []),
-                popularity=artist.get("popularity", 0),
-            )
+            return await self._artist_batcher.submit(artist_id)
         except Exception as e:
             logger.error(f"Error getting artist {artist_id}: {e}")
             return None
     
+    async def _fetch_artists_by_ids(self, artist_ids: list[str]) -> dict[str, SpotifyArtist]:
+        """Fetch up to 50 artists in one request and cache them."""
+        results = await self._get("/artists", {"ids": ",".join(artist_ids)})
+        fetched = {
+            a["id"]: SpotifyArtist(
+                artist_id=a["id"],
+                name=a["name"],
+                genres=a.get("genres", []),
+                popularity=a.get("popularity", 0),
+            )
+            for a in results["artists"] if a
+        }
+        await self._cache_put_many([self._artist_entry(a) for a in fetched.values()])
+        return fetched
+    
     @retry_with_backoff(retries=3, initial_backoff=1)
     async def get_artists_batch(self, artist_ids: list[str]) -> list[SpotifyArtist]:
         """Get multiple artists in batch (max 50)."""
         if not artist_ids:
             return []
         
-        loop = asyncio.get_event_loop()
-        artists = []
+        cached = await self._cache_get_many([f"artist:{artist_id}" for artist_id in artist_ids])
+        artists = list(cached.values())
+        uncached = [artist_id for artist_id in artist_ids if f"artist:{artist_id}" not in cached]
         
         # Spotify API allows max 50 artists per request
-        for i in range(0, len(artist_ids), 50):
-            batch = artist_ids[i:i+50]
+        for i in range(0, len(uncached), 50):
+            batch = uncached[i:i+50]
             try:
-                results = await loop.run_in_executor(
-                    None,
-                    partial(self.sp.artists, batch)
-                )
-                for a in results["artists"]:
-                    if a:
-                        artists.append(SpotifyArtist(
-                            artist_id=a["id"],
-                            name=a["name"],
-                            genres=a.get("genres", []),
-                            popularity=a.get("popularity", 0),
-                        ))
+                artists.extend((await self._fetch_artists_by_ids(batch)).values())
             except Exception as e:
                 logger.error(f"Error getting artist batch: {e}")
         
         return artists
     
+    async def search_tracks_batch(
+        self,
+        tracks: list[tuple[str, str]],
+        on_progress: Callable[[int, int], Awaitable[None]] | None = None,
+    ) -> list[SpotifyTrack | None]:
+        """
+        Search for many (title, artist) pairs and attach artist genres.
+        
+        Repeated pairs are only searched once, and genres are fetched with
+        batched artist requests instead of one request per track.
+        on_progress(done, total) is awaited after every 10 searches.
+        Results are index-aligned with the input.
+        """
+        unique = list(dict.fromkeys(tracks))
+        done = 0
+        
+        async def search(title: str, artist: str) -> SpotifyTrack | None:
+            nonlocal done
+            result = await self.search_track(f"{artist} {title}")
+            done += 1
+            if on_progress and done % 10 == 0 and done < len(unique):
+                try:
+                    await on_progress(done, len(unique))
+                except Exception as e:
+                    logger.debug(f"Import progress update failed: {e}")
+            return result
+        
+        found = await asyncio.gather(*(search(title, artist) for title, artist in unique))
+        by_key = dict(zip(unique, found))
+        
+        artist_ids = list({t.artist_id for t in found if t})
+        artist_genres = {a.artist_id: a.genres for a in await self.get_artists_batch(artist_ids)}
+        
+        # Artists a failed batch missed; concurrent get_artist calls coalesce into one request
+        missing = [artist_id for artist_id in artist_ids if artist_id not in artist_genres]
+        for artist in await asyncio.gather(*(self.get_artist(artist_id) for artist_id in missing)):
+            if artist:
+                artist_genres[artist.artist_id] = artist.genres
+        
+        for track in found:
+            if track:
+                track.genres = artist_genres.get(track.artist_id, [])
+        
+        return [by_key[key] for key in tracks]
+    
     @retry_with_backoff(retries=3, initial_backoff=1)
     async def get_artist_top_tracks(self, artist_id: str, country: str = "US") -> list[SpotifyTrack]:
         """Get artist's top tracks."""
-        loop = asyncio.get_event_loop()
         try:
-            results = await loop.run_in_executor(
-                None,
-                partial(self.sp.artist_top_tracks, artist_id, country=country)
-            )
+            results = await self._get(f"/artists/{artist_id}/top-tracks", {"market": country})
             
             tracks = []
             for track in results["tracks"]:
@@ -197,12 +643,8 @@ class SpotifyService:
     @retry_with_backoff(retries=3, initial_backoff=1)
     async def get_related_artists(self, artist_id: str) -> list[SpotifyArtist]:
         """Get related artists."""
-        loop = asyncio.get_event_loop()
         try:
-            results = await loop.run_in_executor(
-                None,
-                partial(self.sp.artist_related_artists, artist_id)
-            )
+            results = await self._get(f"/artists/{artist_id}/related-artists")
             return [
                 SpotifyArtist(
                     artist_id=a["id"],
@@ -219,33 +661,34 @@ class SpotifyService:
     @retry_with_backoff(retries=3, initial_backoff=1)
     async def get_playlist_tracks(self, playlist_url: str) -> list[SpotifyTrack]:
         """Get all tracks from a Spotify playlist."""
-        loop = asyncio.get_event_loop()
         try:
-            # Extract playlist ID from URL
-            playlist_id = self._extract_playlist_id(playlist_url)
-            if not playlist_id:
-                return []
-            
-            results = await loop.run_in_executor(
-                None,
-                partial(self.sp.playlist, playlist_id)
-            )
-            
             tracks = []
-            items = results["tracks"]["items"]
-            
-            # Handle pagination
-            next_url = results["tracks"]["next"]
-            while next_url:
-                next_results = await loop.run_in_executor(
-                    None,
-                    partial(self.sp.next, results["tracks"])
-                )
-                items.extend(next_results["items"])
-                next_url = next_results.get("next")
-                results["tracks"] = next_results
-            
-            for item in items:
+            async for page in self.iter_playlist_pages(playlist_url):
+                tracks.extend(page)
+            return tracks
+        except Exception as e:
+            logger.error(f"Error getting playlist: {e}")
+            return []
+    
+    async def iter_playlist_pages(self, playlist_url: str) -> AsyncIterator[list[SpotifyTrack]]:
+        """
+        Yield a playlist's tracks one API page (up to 100 tracks) at a time.
+        
+        Lets callers start processing the first page while later pages are
+        still being fetched. Errors are raised to the caller.
+        """
+        # Extract playlist ID from URL
+        playlist_id = self._extract_playlist_id(playlist_url)
+        if not playlist_id:
+            return
+        
+        results = await self._get(f"/playlists/{playlist_id}")
+        page = results["tracks"]
+        
+        # Handle pagination
+        while page:
+            tracks = []
+            for item in page["items"]:
                 track = item.get("track")
                 if not track or not track.get("id"):
                     continue
@@ -260,11 +703,10 @@ class SpotifyService:
                     duration_seconds=track["duration_ms"] // 1000,
                     popularity=track["popularity"],
                 ))
+            yield tracks
             
-            return tracks
-        except Exception as e:
-            logger.error(f"Error getting playlist: {e}")
-            return []
+            next_url = page.get("next")
+            page = await self._get(next_url) if next_url else None
     
     def _extract_playlist_id(self, url_or_id: str) -> str | None:
         """Extract playlist ID from URL or return as-is if already an ID."""
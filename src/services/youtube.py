@@ -4,8 +4,8 @@ YouTube Music API Wrapper
 import asyncio
 import logging
 import re
+import threading
 from dataclasses import dataclass
-from functools import partial
 from typing import Any
 
 import yt_dlp
@@ -69,16 +69,39 @@ class YouTubeService:
             self._ydl_opts["cookiefile"] = cookies_path
         if po_token:
             self._ydl_opts["extractor_args"] = {"youtube": {"po_token": [po_token]}}
+        # One YoutubeDL per executor thread, reused across extractions so the
+        # extractor registry and HTTP connection pool aren't rebuilt every call
+        self._ydl_local = threading.local()
+        self._ydl_instances: list[yt_dlp.YoutubeDL] = []
+        self._ydl_instances_lock = threading.Lock()
+    
+    def _get_ydl(self) -> yt_dlp.YoutubeDL:
+        """Get the YoutubeDL instance for the current thread (created on first use)."""
+        ydl = getattr(self._ydl_local, "ydl", None)
+        if ydl is None:
+            ydl = yt_dlp.YoutubeDL(self._ydl_opts)
+            self._ydl_local.ydl = ydl
+            with self._ydl_instances_lock:
+                self._ydl_instances.append(ydl)
+        return ydl
+    
+    async def aclose(self) -> None:
+        """Close all cached YoutubeDL instances."""
+        with self._ydl_instances_lock:
+            instances, self._ydl_instances = self._ydl_instances, []
+            self._ydl_local = threading.local()
+        
+        for ydl in instances:
+            try:
+                await asyncio.to_thread(ydl.close)
+            except Exception as e:
+                logger.debug(f"Error closing YoutubeDL: {e}")
     
     @retry_with_backoff()
     async def search(self, query: str, filter_type: str = "songs", limit: int = 5) -> list[YTTrack]:
         """Search YouTube Music for tracks."""
-        loop = asyncio.get_event_loop()
         try:
-            results = await loop.run_in_executor(
-                None,
-                partial(self.yt.search, query, filter=filter_type, limit=limit)
-            )
+            results = await asyncio.to_thread(self.yt.search, query, filter=filter_type, limit=limit)
             
             tracks = []
             for r in results:
@@ -114,12 +137,8 @@ class YouTubeService:
     @retry_with_backoff()
     async def get_watch_playlist(self, video_id: str, limit: int = 20) -> list[YTTrack]:
         """Get related tracks from a video's watch playlist."""
-        loop = asyncio.get_event_loop()
         try:
-            results = await loop.run_in_executor(
-                None,
-                partial(self.yt.get_watch_playlist, videoId=video_id, limit=limit)
-            )
+            results = await asyncio.to_thread(self.yt.get_watch_playlist, videoId=video_id, limit=limit)
             
             tracks = []
             for t in results.get("tracks", []):
@@ -146,12 +165,8 @@ class YouTubeService:
     @retry_with_backoff()
     async def get_playlist_tracks(self, playlist_id: str, limit: int = 100) -> list[YTTrack]:
         """Get tracks from a YouTube Music playlist."""
-        loop = asyncio.get_event_loop()
         try:
-            results = await loop.run_in_executor(
-                None,
-                partial(self.yt.get_playlist, playlist_id, limit=limit)
-            )
+            results = await asyncio.to_thread(self.yt.get_playlist, playlist_id, limit=limit)
             
             tracks = []
             for t in results.get("tracks", []):
@@ -177,12 +192,8 @@ class YouTubeService:
     @retry_with_backoff()
     async def get_track_info(self, video_id: str) -> YTTrack | None:
         """Get full track info for a specific video."""
-        loop = asyncio.get_event_loop()
         try:
-            r = await loop.run_in_executor(
-                None,
-                partial(self.yt.get_song, videoId=video_id)
-            )
+            r = await asyncio.to_thread(self.yt.get_song, videoId=video_id)
             
             video_details = r.get("videoDetails", {})
             if not video_details:
@@ -207,16 +218,14 @@ class YouTubeService:
 
     async def get_stream_url(self, video_id: str) -> str | None:
         """Get the audio stream URL for a video using yt-dlp."""
-        loop = asyncio.get_event_loop()
         url = f"https://www.youtube.com/watch?v={video_id}"
         
         try:
             def extract():
-                with yt_dlp.YoutubeDL(self._ydl_opts) as ydl:
-                    info = ydl.extract_info(url, download=False)
-                    return info.get("url")
+                info = self._get_ydl().extract_info(url, download=False)
+                return info.get("url")
             
-            return await loop.run_in_executor(None, extract)
+            return await asyncio.to_thread(extract)
         except Exception as e:
             logger.error(f"Error getting stream URL for {video_id}: {e}")
             return None
@@ -224,12 +233,8 @@ class YouTubeService:
     @retry_with_backoff()
     async def search_playlists(self, query: str, limit: int = 5) -> list[dict]:
         """Search for playlists."""
-        loop = asyncio.get_event_loop()
         try:
-            results = await loop.run_in_executor(
-                None,
-                partial(self.yt.search, query, filter="playlists", limit=limit)
-            )
+            results = await asyncio.to_thread(self.yt.search, query, filter="playlists", limit=limit)
             return [
                 {
                     "browse_id": r.get("browseId"),